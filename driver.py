@@ -5,13 +5,17 @@ FYTA Lite integration for UC Remote.
 This integration connects to the FYTA API to get plant data.
 """
 
+import abc
 import asyncio
+import hashlib
 import json
 import logging
 import os
+import random
+import time
 import uuid
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 import httpx
 import ucapi
@@ -34,29 +38,83 @@ from ucapi.sensor import (
     Commands,
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the standard library json module
+
 # Setup logging
 _LOG = logging.getLogger("driver")
-_LOOP = asyncio.get_event_loop()
+# Create the loop explicitly, get_event_loop() without a running loop is deprecated
+_LOOP = asyncio.new_event_loop()
+asyncio.set_event_loop(_LOOP)
 
 # Global variables
 api = ucapi.IntegrationAPI(_LOOP)
 _CONFIG_FILE = "config.json"
+_ENTITIES_FILE = "entities.json"
+_CONFIG_DIR = os.getenv("UC_CONFIG_HOME") or os.getcwd()
+_CONFIG_PATH = os.path.join(_CONFIG_DIR, _CONFIG_FILE)
+_ENTITIES_PATH = os.path.join(_CONFIG_DIR, _ENTITIES_FILE)
 _fyta_config = None
-_plant_sensors = {}  # Dictionary to keep track of plant sensors
-
-# FYTA API endpoints
-FYTA_AUTH_URL = "https://web.fyta.de/api/auth/login"
-FYTA_USER_PLANTS_URL = "https://web.fyta.de/api/user-plant"
-FYTA_PLANT_DETAILS_URL = "https://web.fyta.de/api/user-plant/{plant_id}"
+_config_mtime = 0.0  # Modification time of the config file when it was last read or written
+_config_bytes: Optional[bytes] = None  # Content last written to the config file
+_entities_data: Optional[Dict[str, dict]] = None  # Entity data last read from or written to the entities file
+_entities_mtime = 0.0  # Modification time of the entities file matching _entities_data
+_entities_digest: Optional[bytes] = None  # BLAKE2b digest of the bytes last written to the entities file
+_plant_sensors: Dict[str, tuple] = {}  # Plant ID -> (temperature sensor, moisture sensor), either may be None
+_sensor_kind: Dict[str, str] = {}  # Entity ID -> sensor SENSOR_TYPE, filled when sensors are created
+_http_client: Optional[httpx.AsyncClient] = None  # Shared client, reuses connections to the FYTA API
+
+# FYTA API endpoints (relative to the shared client's base URL)
+FYTA_BASE_URL = "https://web.fyta.de"
+FYTA_AUTH_URL = "/api/auth/login"
+FYTA_USER_PLANTS_URL = "/api/user-plant"  # Plant details live at FYTA_USER_PLANTS_URL/<plant_id>
 
 # Settings constants
 MAX_STARTUP_RETRIES = 5
-RETRY_DELAY_SECONDS = 10
+RETRY_DELAY_SECONDS = 1  # First delay between network checks, doubled on every further attempt
+RETRY_MAX_DELAY_SECONDS = 30  # Upper bound of the delay between network checks
+NETWORK_CHECK_TIMEOUT_SECONDS = 3.0  # Timeout of a single network connectivity probe
 API_RETRY_ATTEMPTS = 3  # Number of times to retry API calls on timeout
 API_RETRY_DELAY = 3  # Seconds to wait between retries
-
-
-@dataclass
+API_TIMEOUT_SECONDS = 10.0  # Timeout for reading a FYTA API response
+API_CONNECT_TIMEOUT_SECONDS = 5.0  # Timeout for establishing a connection to the FYTA API
+API_WRITE_TIMEOUT_SECONDS = 5.0  # Timeout for sending a request body
+API_POOL_TIMEOUT_SECONDS = 2.0  # Timeout for waiting on a free connection from the pool
+API_MAX_CONNECTIONS = 20  # Upper bound of open connections in the shared client pool
+API_MAX_KEEPALIVE_CONNECTIONS = 10  # Idle connections kept open in the shared client pool
+API_KEEPALIVE_EXPIRY_SECONDS = 60.0  # Close idle pooled connections after this long
+API_MAX_CONCURRENT_DETAILS = 8  # Plant detail requests allowed in flight at once
+TOKEN_REFRESH_MARGIN_SECONDS = 30  # Refresh the access token this long before it expires
+PLANT_DETAILS_CACHE_SECONDS = 600  # Reuse fetched plant details for this long, e.g. on reconnects between periodic updates
+PERIODIC_MAX_INTERVAL_MINUTES = 120  # Longest interval periodic updates back off to while no values change
+PERIODIC_RETRY_SECONDS = 30  # First retry delay after a failed scheduled update
+PERIODIC_BACKOFF_AFTER_UNCHANGED = 2  # Unchanged periodic updates in a row before the interval is doubled
+ENTITIES_SCHEMA_VERSION = 1  # Version of the entity records in the entities file, 1 stores plain nicknames
+
+_details_semaphore = asyncio.Semaphore(API_MAX_CONCURRENT_DETAILS)  # Bounds concurrent plant detail requests
+_token_lock = asyncio.Lock()  # Serializes proactive token refreshes
+_store_task: Optional[asyncio.Task] = None  # Background writer for the entities file
+_pending_entities: Optional[Dict[str, dict]] = None  # Changed entity records waiting to be written by _store_task
+_dirty_sensors: Dict[str, "PlantSensor"] = {}  # Entity ID -> sensor whose stored record is out of date
+_refresh_task: Optional[asyncio.Task] = None  # Background entity refresh started at startup or on connect
+_details_cache: Dict[str, tuple] = {}  # Plant ID -> (monotonic expiry time, plant details)
+_plant_version: Dict[str, tuple] = {}  # Plant ID -> ("updated_at" last applied to the sensors, monotonic time it may be skipped until)
+
+# Measurement status text, indexed by the FYTA status code
+_STATUS_TEXT = ("No Data", "Too Low", "Low", "Perfect", "High", "Too High")
+STATUS_UNKNOWN = "Unknown"  # Status text for codes outside _STATUS_TEXT
+
+# Attribute key written on every sensor update, bound once instead of looked up on the enum each time
+_ATTR_VALUE = Attributes.VALUE
+
+# Constant part of the attributes pushed for a sensor that is on, only the value is added per update
+_TEMP_ON_BASE = {Attributes.STATE: States.ON, Attributes.UNIT: "°C"}
+_MOISTURE_ON_BASE = {Attributes.STATE: States.ON}
+
+
+@dataclass(slots=True)
 class FytaConfig:
     """Configuration for FYTA API."""
     id: str
@@ -65,11 +123,104 @@ class FytaConfig:
     access_token: Optional[str] = None
     refresh_token: Optional[str] = None
     expires_in: Optional[int] = None
+    token_expires_at: Optional[float] = None  # Unix time when the access token expires
+
+
+def temp_sensor_id(plant_id: str) -> str:
+    """Get the entity ID of the temperature sensor of a plant."""
+    return f"fyta-plant-{plant_id}"
+
+
+def moisture_sensor_id(plant_id: str) -> str:
+    """Get the entity ID of the moisture sensor of a plant."""
+    return f"fyta-moisture-{plant_id}"
+
+
+def legacy_nickname(nickname, suffix: str):
+    """
+    Get the plant nickname from an entity record stored before schema version 1.
+
+    Those records stored the entity name, including the sensor suffix.
+
+    :param nickname: Stored nickname
+    :param suffix: Sensor name suffix to remove
+    :return: Plant nickname
+    """
+    if isinstance(nickname, dict):
+        # If nickname is a dictionary, convert to string
+        return str(nickname)
+    if isinstance(nickname, str) and suffix and nickname.endswith(suffix):
+        # If it's a string with suffix, slice the suffix off
+        return nickname[:-len(suffix)]
+    return nickname
+
+
+class PlantSensor(Sensor, abc.ABC):
+    """Base class for the sensor entities created for a FYTA plant."""
+    
+    SENSOR_TYPE = ""  # Type name stored in the entities file
+    NAME_SUFFIX = ""  # Appended to the plant nickname to form the entity name
+    MEASUREMENT = ""  # Key of the sensor's data in the plant measurements
+    ON_ATTRIBUTES: Dict[Any, Any] = {}  # Constant attributes pushed with every value of a configured sensor
+    
+    @abc.abstractmethod
+    def apply_measurement(self, data: Dict[str, Any], battery_low: bool) -> bool:
+        """
+        Update the sensor attributes from its measurement data.
+        
+        :param data: Measurement data with "status" and "values"
+        :param battery_low: Whether the plant's sensor reports a low battery
+        :return: True if the attributes changed
+        """
+    
+    def restore_attributes(self, stored: Dict[str, Any]) -> None:
+        """
+        Restore the attributes shown before the first update from a stored record.
+        
+        :param stored: Attributes of the stored entity record
+        """
+        self.attributes[_ATTR_VALUE] = stored.get(_ATTR_VALUE, self._ATTR_TEMPLATE[_ATTR_VALUE])
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serialize the sensor for the entities file.
+        
+        The nickname is always stored as a string, so records of the current
+        schema version can be read back without type checks.
+        
+        :return: Dictionary with the data needed to restore the sensor
+        """
+        nickname = self.nickname
+        if not isinstance(nickname, str):
+            # Same text the entity name was built from
+            nickname = str(nickname)
+        return {
+            "type": self.SENSOR_TYPE,
+            "schema_version": ENTITIES_SCHEMA_VERSION,
+            "plant_id": self.plant_id,
+            "nickname": nickname,
+            "scientific_name": self.scientific_name,
+            "attributes": dict(self.attributes)
+        }
 
 
-class PlantTemperatureSensor(Sensor):
+class PlantTemperatureSensor(PlantSensor):
     """Class representing a FYTA plant sensor."""
     
+    SENSOR_TYPE = "temperature"
+    NAME_SUFFIX = " Temperature"
+    MEASUREMENT = "temperature"
+    ON_ATTRIBUTES = _TEMP_ON_BASE
+    
+    # Attribute and option defaults, copied for every new sensor
+    _ATTR_TEMPLATE = {
+        Attributes.STATE: States.UNKNOWN,
+        Attributes.VALUE: "0",
+    }
+    _OPTIONS = {
+        "decimals": 1  # Show one decimal place for temperature
+    }
+    
     def __init__(self, plant_id: str, nickname: str, scientific_name: str):
         """
         Initialize a plant sensor entity.
@@ -78,23 +229,16 @@ class PlantTemperatureSensor(Sensor):
         :param nickname: Plant nickname
         :param scientific_name: Scientific name of the plant
         """
-        identifier = f"fyta-plant-{plant_id}"
-        name = f"{nickname} Temperature"
+        identifier = temp_sensor_id(plant_id)
+        name = f"{nickname}{self.NAME_SUFFIX}"
         
         # Initialize attributes with defaults
-        attributes = {
-            Attributes.STATE: States.UNKNOWN,
-            Attributes.VALUE: "0",
-            "scientific_name": scientific_name,
-        }
-        
-        # Configure appropriate options
-        options = {
-            "decimals": 1  # Show one decimal place for temperature
-        }
+        attributes = {**self._ATTR_TEMPLATE, "scientific_name": scientific_name}
+        options = self._OPTIONS.copy()
         
         # Store FYTA-specific data that we'll need later
         self.plant_id = plant_id
+        self.nickname = nickname
         self.scientific_name = scientific_name
         self.temperature = None
         self.temperature_status = None
@@ -109,11 +253,61 @@ class PlantTemperatureSensor(Sensor):
             device_class=DeviceClasses.TEMPERATURE,
             options=options
         )
+    
+    def apply_measurement(self, data: Dict[str, Any], battery_low: bool) -> bool:
+        """
+        Update the temperature value and status text from the measurement data.
+        
+        A status of 0 (no data) shows "0", without a current value the
+        previous value is kept.
+        
+        :param data: Measurement data with "status" and "values"
+        :param battery_low: Whether the plant's sensor reports a low battery, not shown here
+        :return: True if the attributes changed
+        """
+        attributes = self.attributes
+        values = data.get("values") or {}
+        status = data.get("status")
+        changed = False
+        
+        value = None
+        if status == 0:
+            value = "0"
+        elif "current" in values:
+            value = values["current"]
+            if not isinstance(value, str):
+                value = str(value)
+        if value is not None and attributes[_ATTR_VALUE] != value:
+            attributes[_ATTR_VALUE] = value
+            changed = True
+        
+        # Keep the raw status code and only rebuild the text when it changes
+        if self.temperature_status != status or "status" not in attributes:
+            self.temperature_status = status
+            attributes["status"] = get_measurement_status_text(status)
+            changed = True
+        return changed
 
 
-class PlantMoistureSensor(Sensor):
+class PlantMoistureSensor(PlantSensor):
     """Class representing a FYTA plant moisture sensor that shows status text."""
     
+    SENSOR_TYPE = "moisture"
+    NAME_SUFFIX = " Moisture"
+    MEASUREMENT = "moisture"
+    ON_ATTRIBUTES = _MOISTURE_ON_BASE
+    BATTERY_LOW_SUFFIX = " (Battery Low)"  # Appended to the status text while the battery is low
+    
+    # Attribute and option defaults, copied for every new sensor
+    _ATTR_TEMPLATE = {
+        Attributes.STATE: States.UNKNOWN,
+        Attributes.VALUE: "Unknown",
+        "battery_low": False,
+    }
+    _OPTIONS = {
+        "custom_unit": "Status"  # Show status as unit for moisture
+    }
+    
     def __init__(self, plant_id: str, nickname: str, scientific_name: str):
         """
         Initialize a plant moisture sensor entity.
@@ -122,23 +316,16 @@ class PlantMoistureSensor(Sensor):
         :param nickname: Plant nickname
         :param scientific_name: Scientific name of the plant
         """
-        identifier = f"fyta-moisture-{plant_id}"
-        name = f"{nickname} Moisture"
+        identifier = moisture_sensor_id(plant_id)
+        name = f"{nickname}{self.NAME_SUFFIX}"
         
         # Initialize attributes with defaults
-        attributes = {
-            Attributes.STATE: States.UNKNOWN,
-            Attributes.VALUE: "Unknown",
-            "scientific_name": scientific_name,
-        }
-        
-        # Configure appropriate options
-        options = {
-            "custom_unit": "Status"  # Show status as unit for moisture
-        }
+        attributes = {**self._ATTR_TEMPLATE, "scientific_name": scientific_name}
+        options = self._OPTIONS.copy()
         
         # Store FYTA-specific data that we'll need later
         self.plant_id = plant_id
+        self.nickname = nickname
         self.scientific_name = scientific_name
         self.moisture_status = None
         self.last_updated = None
@@ -152,6 +339,62 @@ class PlantMoistureSensor(Sensor):
             device_class=DeviceClasses.CUSTOM,
             options=options
         )
+    
+    def apply_measurement(self, data: Dict[str, Any], battery_low: bool) -> bool:
+        """
+        Update the moisture status text from the measurement data.
+        
+        The battery state is kept in its own attribute, the value text only
+        gets BATTERY_LOW_SUFFIX for display on the Remote and is
+        rebuilt only when the status text or the battery state changes.
+        
+        :param data: Measurement data with "status" and "values"
+        :param battery_low: Whether the plant's sensor reports a low battery
+        :return: True if the attributes changed
+        """
+        # Codes 0 and 1 already map to "No Data" and "Too Low", whatever the current value is
+        value = get_measurement_status_text(data.get("status"))
+        
+        attributes = self.attributes
+        if self.moisture_status == value and attributes["battery_low"] == battery_low:
+            return False
+        self.moisture_status = value
+        attributes["battery_low"] = battery_low
+        attributes[_ATTR_VALUE] = f"{value}{self.BATTERY_LOW_SUFFIX}" if battery_low else value
+        return True
+    
+    def restore_attributes(self, stored: Dict[str, Any]) -> None:
+        """
+        Restore the value, battery state and status text from a stored record.
+        
+        Records written before battery_low was stored only have the suffix in
+        the value text.
+        
+        :param stored: Attributes of the stored entity record
+        """
+        super().restore_attributes(stored)
+        value = self.attributes[_ATTR_VALUE]
+        suffix = self.BATTERY_LOW_SUFFIX
+        battery_low = stored.get("battery_low")
+        if battery_low is None:
+            battery_low = isinstance(value, str) and value.endswith(suffix)
+        self.attributes["battery_low"] = bool(battery_low)
+        if battery_low and isinstance(value, str) and value.endswith(suffix):
+            value = value[:-len(suffix)]
+        self.moisture_status = value
+
+
+# Sensor classes in the order of the (temperature, moisture) pairs in _plant_sensors
+_PAIR_CLASSES = (PlantTemperatureSensor, PlantMoistureSensor)
+
+# Sensor class for each type name in the entities file
+_SENSOR_CLASSES = {cls.SENSOR_TYPE: cls for cls in _PAIR_CLASSES}
+
+# Default value and constant attributes set when a sensor is subscribed, by sensor type
+_SUB_DEFAULTS = {
+    PlantTemperatureSensor.SENSOR_TYPE: ("0", PlantTemperatureSensor.ON_ATTRIBUTES),
+    PlantMoistureSensor.SENSOR_TYPE: (STATUS_UNKNOWN, PlantMoistureSensor.ON_ATTRIBUTES),
+}
 
 
 # Setup flow for configuring the FYTA API
@@ -163,6 +406,9 @@ class SetupSteps:
 
 _setup_step = SetupSteps.INIT
 
+# Built once and returned for every setup request, including restarts after an
+# abort. ucapi only serializes it into the setup message and never mutates it,
+# so sharing the instance is safe and must stay that way.
 _user_input_config = RequestUserInput(
     {"en": "FYTA Account Configuration"},
     [
@@ -228,7 +474,7 @@ async def driver_setup_handler(msg: SetupDriver) -> SetupAction:
 
 
 async def handle_driver_setup() -> RequestUserInput:
-    """Start the driver setup process."""
+    """Start the driver setup process with the shared credentials form."""
     global _setup_step
     _setup_step = SetupSteps.ACCOUNT_CONFIG
     return _user_input_config
@@ -261,14 +507,12 @@ async def handle_account_config(msg: UserDataResponse) -> SetupComplete | SetupE
         _fyta_config = FytaConfig(
             id=config_id,
             email=email,
-            password=password,
-            access_token=auth_response.get("access_token"),
-            refresh_token=auth_response.get("refresh_token"),
-            expires_in=auth_response.get("expires_in")
+            password=password
         )
+        apply_auth_response(_fyta_config, auth_response)
 
         # Save configuration
-        save_config(_fyta_config)
+        await save_config_async(_fyta_config)
         _LOG.info("Successfully authenticated with FYTA API")
         
         # Create plant sensors using the update function
@@ -289,20 +533,74 @@ async def handle_account_config(msg: UserDataResponse) -> SetupComplete | SetupE
         return SetupError(f"Error: {str(e)}")
 
 
+def encode_json(data: Any) -> bytes:
+    """
+    Serialize data to UTF-8 encoded JSON, using orjson when it is installed.
+
+    Non-string keys such as the ucapi attribute enums are written as strings.
+
+    :param data: Data to serialize
+    :return: Compact JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def decode_json(data: bytes) -> Any:
+    """
+    Parse a JSON document, using orjson when it is installed.
+
+    :param data: UTF-8 encoded JSON document
+    :return: Parsed data
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def write_file_atomic(path: str, payload: bytes) -> None:
+    """
+    Replace a file with new content so readers never see a partial write.
+
+    :param path: File to replace
+    :param payload: New file content
+    """
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
 def save_config(config: FytaConfig) -> bool:
-    """Save the configuration to a file."""
+    """
+    Save the configuration to a file.
+
+    The file is replaced atomically, and not written at all if its content
+    would not change.
+    """
+    global _config_mtime, _config_bytes
 
     try:
-        config_path = os.path.join(os.getenv("UC_CONFIG_HOME", os.getcwd()), _CONFIG_FILE)
-        with open(config_path, "w", encoding="utf-8") as f:
-            json.dump({
-                "id": config.id,
-                "email": config.email,
-                "password": config.password,
-                "access_token": config.access_token,
-                "refresh_token": config.refresh_token,
-                "expires_in": config.expires_in
-            }, f, ensure_ascii=False)
+        config_path = _CONFIG_PATH
+        payload = encode_json({
+            "id": config.id,
+            "email": config.email,
+            "password": config.password,
+            "access_token": config.access_token,
+            "refresh_token": config.refresh_token,
+            "expires_in": config.expires_in,
+            "token_expires_at": config.token_expires_at
+        })
+        if payload == _config_bytes and os.path.exists(config_path):
+            _LOG.debug("Configuration unchanged, not rewriting %s", config_path)
+            return True
+
+        write_file_atomic(config_path, payload)
+        _config_bytes = payload
+        _config_mtime = os.stat(config_path).st_mtime
         _LOG.info("Successfully saved configuration to file: %s", config_path)
         return True
     except Exception as e:
@@ -310,12 +608,37 @@ def save_config(config: FytaConfig) -> bool:
         return False
 
 
+async def save_config_async(config: FytaConfig) -> bool:
+    """
+    Save the configuration to a file without blocking the event loop.
+
+    :param config: Configuration to save
+    :return: True if the configuration was saved
+    """
+    return await asyncio.get_running_loop().run_in_executor(None, save_config, config)
+
+
 def store_entities(entities_data: Dict[str, dict]) -> bool:
-    """Store entity data to a file for persistence across reboots."""
+    """
+    Store entity data to a file for persistence across reboots.
+
+    The file is replaced atomically, and not written at all if its content
+    would not change.
+    """
+    global _entities_data, _entities_mtime, _entities_digest
+
     try:
-        entities_path = os.path.join(os.getenv("UC_CONFIG_HOME", os.getcwd()), "entities.json")
-        with open(entities_path, "w", encoding="utf-8") as f:
-            json.dump(entities_data, f, ensure_ascii=False)
+        entities_path = _ENTITIES_PATH
+        payload = encode_json(entities_data)
+        digest = hashlib.blake2b(payload, digest_size=16).digest()
+        if digest == _entities_digest and os.path.exists(entities_path):
+            _LOG.debug("Entities unchanged, not rewriting %s", entities_path)
+            return True
+
+        write_file_atomic(entities_path, payload)
+        _entities_digest = digest
+        _entities_data = entities_data
+        _entities_mtime = os.stat(entities_path).st_mtime
         _LOG.info("Successfully saved %d entities to file: %s", len(entities_data), entities_path)
         return True
     except Exception as e:
@@ -323,45 +646,244 @@ def store_entities(entities_data: Dict[str, dict]) -> bool:
         return False
 
 
+def store_entities_partial(changed_entities: Dict[str, dict]) -> bool:
+    """
+    Merge changed entity records into the stored entities and write them.
+
+    :param changed_entities: Records of the changed entities, by entity ID
+    :return: True if the entities were stored
+    """
+    return store_entities({**load_entities(), **changed_entities})
+
+
+def schedule_store_entities(changed_entities: Dict[str, dict]) -> None:
+    """
+    Store changed entity records from a background task without blocking the event loop.
+
+    Calls made while a write is in progress are coalesced, their records are
+    merged and written together once that write finishes.
+
+    :param changed_entities: Records of the changed entities, by entity ID
+    """
+    global _pending_entities, _store_task
+    if _pending_entities is None:
+        _pending_entities = dict(changed_entities)
+    else:
+        _pending_entities.update(changed_entities)
+    if _store_task is None or _store_task.done():
+        _store_task = asyncio.create_task(flush_pending_entities())
+
+
+async def flush_pending_entities() -> None:
+    """
+    Write queued entity records in the default executor until nothing is pending.
+
+    Records of a failed write are queued again, below any newer ones, and
+    retried with the next scheduled store instead of right away.
+    """
+    global _pending_entities
+    loop = asyncio.get_running_loop()
+    while _pending_entities is not None:
+        changed_entities, _pending_entities = _pending_entities, None
+        if not await loop.run_in_executor(None, store_entities_partial, changed_entities):
+            _pending_entities = {**changed_entities, **(_pending_entities or {})}
+            _LOG.warning("Keeping %d entity records to store with the next update", len(_pending_entities))
+            return
+
+
 def load_entities() -> Dict[str, dict]:
-    """Load entity data from file."""
+    """
+    Load entity data from file.
+
+    The file is only parsed again if it changed since it was last read or
+    written, otherwise the entity data already in memory is returned.
+    """
+    global _entities_data, _entities_mtime
+
     try:
-        entities_path = os.path.join(os.getenv("UC_CONFIG_HOME", os.getcwd()), "entities.json")
+        entities_path = _ENTITIES_PATH
         if not os.path.exists(entities_path):
             _LOG.info("No stored entities file found")
             return {}
+
+        mtime = os.stat(entities_path).st_mtime
+        if _entities_data is not None and mtime == _entities_mtime:
+            return _entities_data
             
         _LOG.info("Loading entities from file: %s", entities_path)
-        with open(entities_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(entities_path, "rb") as f:
+            _entities_data = decode_json(f.read())
+            _entities_mtime = mtime
+            return _entities_data
     except Exception as e:
         _LOG.error("Failed to load entities: %s", e)
         return {}
 
 
 def load_config() -> Optional[FytaConfig]:
-    """Load the configuration from a file."""
+    """
+    Load the configuration from a file.
+
+    The file is only parsed again if it changed since it was last read or
+    written, otherwise the configuration already in memory is returned.
+    """
+    global _config_mtime
+
     try:
-        config_path = os.path.join(os.getenv("UC_CONFIG_HOME", os.getcwd()), _CONFIG_FILE)
+        config_path = _CONFIG_PATH
         if not os.path.exists(config_path):
             return None
+
+        mtime = os.stat(config_path).st_mtime
+        if _fyta_config is not None and mtime == _config_mtime:
+            return _fyta_config
             
         _LOG.info("Loading configuration from file: %s", config_path)
-        with open(config_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(config_path, "rb") as f:
+            data = decode_json(f.read())
+            _config_mtime = mtime
             return FytaConfig(
                 id=data.get("id", str(uuid.uuid4())),
                 email=data.get("email", ""),
                 password=data.get("password", ""),
                 access_token=data.get("access_token"),
                 refresh_token=data.get("refresh_token"),
-                expires_in=data.get("expires_in")
+                expires_in=data.get("expires_in"),
+                token_expires_at=data.get("token_expires_at")
             )
     except Exception as e:
         _LOG.error("Failed to load configuration: %s", e)
         return None
 
 
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client for the FYTA API, creating it on first use.
+
+    Reusing a single client keeps connections alive between requests, so the
+    TCP and TLS handshake is only paid once instead of on every API call.
+    With HTTP/2 the concurrent detail requests share a single connection.
+
+    :return: The shared HTTP client
+    """
+    global _http_client
+
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            base_url=FYTA_BASE_URL,
+            http2=True,  # Multiplex concurrent plant detail requests over one connection
+            timeout=httpx.Timeout(
+                connect=API_CONNECT_TIMEOUT_SECONDS,
+                read=API_TIMEOUT_SECONDS,
+                write=API_WRITE_TIMEOUT_SECONDS,
+                pool=API_POOL_TIMEOUT_SECONDS
+            ),
+            limits=httpx.Limits(
+                max_connections=API_MAX_CONNECTIONS,
+                max_keepalive_connections=API_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=API_KEEPALIVE_EXPIRY_SECONDS
+            )
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client and release its pooled connections."""
+    global _http_client
+
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def set_auth_token(access_token: Optional[str]) -> None:
+    """
+    Set the bearer token sent with every request of the shared HTTP client.
+
+    :param access_token: FYTA access token, or None to stop sending one
+    """
+    client = get_http_client()
+    if access_token:
+        client.headers["Authorization"] = f"Bearer {access_token}"
+    else:
+        client.headers.pop("Authorization", None)
+
+
+def token_valid(config: FytaConfig, slack: float = TOKEN_REFRESH_MARGIN_SECONDS) -> bool:
+    """
+    Check if the access token can still be used without re-authenticating.
+
+    :param config: Configuration holding the token
+    :param slack: Seconds before expiry from which the token counts as expired
+    :return: True if there is a token that does not expire within slack seconds
+    """
+    if not config.access_token or config.token_expires_at is None:
+        return False
+    return time.time() < config.token_expires_at - slack
+
+
+def apply_auth_response(config: FytaConfig, auth_response: Dict[str, Any]) -> None:
+    """
+    Store the tokens of a successful authentication in the configuration.
+
+    Also records when the access token expires and sends it with the shared
+    HTTP client from now on.
+
+    :param config: Configuration to update
+    :param auth_response: Authentication response from the FYTA API
+    """
+    config.access_token = auth_response.get("access_token")
+    config.refresh_token = auth_response.get("refresh_token")
+    config.expires_in = auth_response.get("expires_in")
+    config.token_expires_at = time.time() + config.expires_in if config.expires_in else None
+    set_auth_token(config.access_token)
+    # Details fetched with the previous token are not reused after re-authenticating
+    _details_cache.clear()
+
+
+async def ensure_valid_token() -> None:
+    """
+    Re-authenticate before the access token expires.
+
+    Refreshing ahead of time saves the failed request and 401 round-trip that
+    would otherwise reveal the expired token. Tokens without a known expiry
+    are used as they are.
+    """
+    expires_at = _fyta_config.token_expires_at
+    if expires_at is None or time.time() < expires_at - TOKEN_REFRESH_MARGIN_SECONDS:
+        return
+    await reauthenticate("access token is about to expire")
+
+
+async def reauthenticate(reason: str) -> bool:
+    """
+    Log in again with the saved credentials and store the new tokens.
+
+    Callers that wait for the lock while another caller logs in reuse the
+    token it obtained instead of logging in a second time.
+
+    :param reason: Why a new token is needed, used in log messages
+    :return: True if a new access token is available
+    """
+    stale_token = _fyta_config.access_token
+    async with _token_lock:
+        if _fyta_config.access_token != stale_token:
+            return True
+
+        _LOG.info("Re-authenticating with FYTA API: %s", reason)
+        try:
+            auth_response = await authenticate_fyta(_fyta_config.email, _fyta_config.password)
+        except Exception as e:
+            _LOG.error("Re-authentication failed: %s", e)
+            return False
+        if not auth_response or "access_token" not in auth_response:
+            _LOG.error("Re-authentication returned no access token")
+            return False
+        apply_auth_response(_fyta_config, auth_response)
+        await save_config_async(_fyta_config)
+        return True
+
+
 async def authenticate_fyta(email: str, password: str) -> Dict[str, Any]:
     """
     Authenticate with FYTA API.
@@ -379,13 +901,13 @@ async def authenticate_fyta(email: str, password: str) -> Dict[str, Any]:
     
     try:
         async def auth_request():
-            async with httpx.AsyncClient() as client:
-                response = await client.post(FYTA_AUTH_URL, json=payload, timeout=10.0)
-                response.raise_for_status()
-                
-                auth_data = response.json()
-                _LOG.info("Successfully authenticated with FYTA API")
-                return auth_data
+            client = get_http_client()
+            response = await client.post(FYTA_AUTH_URL, json=payload)
+            response.raise_for_status()
+            
+            auth_data = decode_json(response.content)
+            _LOG.info("Successfully authenticated with FYTA API")
+            return auth_data
         
         # Use the retry utility function
         auth_data = await retry_api_call(auth_request)
@@ -414,48 +936,40 @@ async def get_user_plants() -> List[Dict[str, Any]]:
         _LOG.error("No valid FYTA authentication token available")
         return []
     
+    await ensure_valid_token()
     _LOG.info("Fetching user plants from FYTA API")
     
-    headers = {
-        "Authorization": f"Bearer {_fyta_config.access_token}"
-    }
+    async def fetch_plants():
+        client = get_http_client()
+        response = await client.get(FYTA_USER_PLANTS_URL)
+        response.raise_for_status()
+        _LOG.debug("FYTA API responded over %s", response.http_version)
+        
+        data = decode_json(response.content)
+        plants = data.get("plants", [])
+        _LOG.info("Retrieved %d plants from FYTA API", len(plants))
+        return plants
     
-    try:
-        async def fetch_plants():
-            async with httpx.AsyncClient() as client:
-                response = await client.get(FYTA_USER_PLANTS_URL, headers=headers, timeout=10.0)
-                response.raise_for_status()
-                
-                data = response.json()
-                plants = data.get("plants", [])
-                _LOG.info("Retrieved %d plants from FYTA API", len(plants))
+    # A rejected token is refreshed once, then the request is tried again
+    for attempt in range(2):
+        try:
+            # Use the retry utility function
+            plants = await retry_api_call(fetch_plants)
+            if plants is not None:
                 return plants
-        
-        # Use the retry utility function
-        plants = await retry_api_call(fetch_plants)
-        if plants is not None:
-            return plants
-        return []
-    except httpx.HTTPStatusError as e:
-        _LOG.error("HTTP error fetching user plants: %s", e)
-        # If token expired, try to re-authenticate
-        if e.response.status_code == 401:
-            _LOG.info("Token expired, attempting to re-authenticate")
-            try:
-                auth_response = await authenticate_fyta(_fyta_config.email, _fyta_config.password)
-                if auth_response and "access_token" in auth_response:
-                    _fyta_config.access_token = auth_response["access_token"]
-                    _fyta_config.refresh_token = auth_response["refresh_token"]
-                    _fyta_config.expires_in = auth_response["expires_in"]
-                    save_config(_fyta_config)
-                    # Try again with new token
-                    return await get_user_plants()
-            except Exception as auth_error:
-                _LOG.error("Re-authentication failed: %s", auth_error)
-        return []
-    except Exception as e:
-        _LOG.error("Unexpected error fetching user plants: %s", e)
-        return []
+            return []
+        except httpx.HTTPStatusError as e:
+            _LOG.error("HTTP error fetching user plants: %s", e)
+            if e.response.status_code != 401 or attempt > 0:
+                return []
+            
+            # If token expired, try to re-authenticate
+            if not await reauthenticate("access token was rejected"):
+                return []
+        except Exception as e:
+            _LOG.error("Unexpected error fetching user plants: %s", e)
+            return []
+    return []
 
 
 async def retry_api_call(api_func, *args, max_retries=API_RETRY_ATTEMPTS, **kwargs):
@@ -467,6 +981,8 @@ async def retry_api_call(api_func, *args, max_retries=API_RETRY_ATTEMPTS, **kwar
     :param args: Positional arguments for the function
     :param kwargs: Keyword arguments for the function
     :return: The result of the API call or None on failure
+    :raises httpx.HTTPStatusError: If the API responded with an error status,
+        so callers can react to it (e.g. re-authenticate on 401)
     """
     last_error = None
     
@@ -483,6 +999,8 @@ async def retry_api_call(api_func, *args, max_retries=API_RETRY_ATTEMPTS, **kwar
                 await asyncio.sleep(retry_delay)
             else:
                 _LOG.error("API call failed after %d retries: %s", max_retries, str(e))
+        except httpx.HTTPStatusError:
+            raise
         except Exception as e:
             # For non-timeout errors, don't retry
             _LOG.error("API call error (not retrying): %s", str(e))
@@ -496,49 +1014,94 @@ async def retry_api_call(api_func, *args, max_retries=API_RETRY_ATTEMPTS, **kwar
         return None
 
 
-async def get_plant_details(plant_id: str) -> Dict[str, Any]:
+async def get_plant_details(plant_id: str, force_refresh: bool = False) -> Dict[str, Any]:
     """
     Get detailed information for a specific plant.
     
+    Details fetched within the last PLANT_DETAILS_CACHE_SECONDS are returned
+    from memory instead of requesting them again.
+    
     :param plant_id: ID of the plant to get details for
+    :param force_refresh: Request the details even if cached ones are still valid
     :return: Detailed plant information
     """
     if not _fyta_config or not _fyta_config.access_token:
         _LOG.error("No valid FYTA authentication token available")
         return {}
     
-    _LOG.info("Fetching details for plant ID: %s", plant_id)
+    if not force_refresh:
+        cached = _details_cache.get(plant_id)
+        if cached and time.monotonic() < cached[0]:
+            _LOG.debug("Using cached details for plant ID: %s", plant_id)
+            return cached[1]
     
-    headers = {
-        "Authorization": f"Bearer {_fyta_config.access_token}"
-    }
+    details = await fetch_plant_details(plant_id)
+    if details:
+        _details_cache[plant_id] = (time.monotonic() + PLANT_DETAILS_CACHE_SECONDS, details)
+    return details
+
+
+async def fetch_plant_details(plant_id: str) -> Dict[str, Any]:
+    """
+    Request the details of a plant from the FYTA API, bypassing the cache.
+    
+    :param plant_id: ID of the plant to get details for
+    :return: Detailed plant information, empty on failure
+    """
+    await ensure_valid_token()
+    _LOG.info("Fetching details for plant ID: %s", plant_id)
     
     try:
         async def get_details():
-            async with httpx.AsyncClient() as client:
-                url = FYTA_PLANT_DETAILS_URL.format(plant_id=plant_id)
-                response = await client.get(url, headers=headers, timeout=10.0)
-                response.raise_for_status()
-                
-                data = response.json()
-                return data.get("plant", {})
+            client = get_http_client()
+            response = await client.get(f"{FYTA_USER_PLANTS_URL}/{plant_id}")
+            response.raise_for_status()
+            
+            data = decode_json(response.content)
+            return data.get("plant", {})
 
-        details = await retry_api_call(get_details)
-        return details
+        async with _details_semaphore:
+            return await retry_api_call(get_details) or {}
     except Exception as e:
         _LOG.error("Error fetching plant details for ID %s: %s", plant_id, e)
         return {}
 
 
+async def get_plant_measurements(plant: Dict[str, Any], plant_id: str) -> Dict[str, Any]:
+    """
+    Get the plant data holding the measurements of a plant.
+
+    The plant list already contains the measurements for some plants, in
+    which case the separate details request is skipped. While the plant's
+    "updated_at" in the list matches the one last applied, cached details
+    are reused until PLANT_DETAILS_CACHE_SECONDS ran out.
+
+    :param plant: Plant entry from the user plants list
+    :param plant_id: ID of the plant
+    :return: Plant data with measurements
+    """
+    if "measurements" in plant:
+        return plant
+    
+    # A changed plant must not be answered from the details cache, an
+    # unchanged one only within the cache time
+    updated_at = plant.get("updated_at")
+    version = _plant_version.get(plant_id)
+    changed = updated_at is not None and (version is None or version[0] != updated_at)
+    return await get_plant_details(plant_id, force_refresh=changed)
+
+
 async def is_network_connected() -> bool:
-    """Check if network is connected by trying to reach FYTA API endpoint."""
+    """
+    Check if network is connected by trying to reach FYTA API endpoint.
+
+    The probe goes through the shared client, so the connection it opens is
+    reused by the API requests that follow.
+    """
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.head(
-                "https://web.fyta.de", 
-                timeout=5.0
-            )
-            return response.status_code < 500  # Any response below 500 means network is working
+        client = get_http_client()
+        response = await client.head("/", timeout=NETWORK_CHECK_TIMEOUT_SECONDS)
+        return response.status_code < 500  # Any response below 500 means network is working
     except Exception:
         return False
 
@@ -546,6 +1109,10 @@ async def is_network_connected() -> bool:
 async def wait_for_network_connection(max_retries=MAX_STARTUP_RETRIES, delay=RETRY_DELAY_SECONDS) -> bool:
     """Wait for network connection with retries.
     
+    The delay between attempts starts at the given delay and doubles on
+    every attempt up to RETRY_MAX_DELAY_SECONDS, with a little random jitter,
+    so short outages are recovered from quickly.
+    
     Returns True if network becomes available, False if max retries exceeded.
     """
     for attempt in range(1, max_retries + 1):
@@ -555,8 +1122,9 @@ async def wait_for_network_connection(max_retries=MAX_STARTUP_RETRIES, delay=RET
             return True
         
         if attempt < max_retries:
-            _LOG.warning("Network not available, retrying in %d seconds...", delay)
-            await asyncio.sleep(delay)
+            retry_delay = min(delay * 2 ** (attempt - 1), RETRY_MAX_DELAY_SECONDS) + random.uniform(0, 0.5)
+            _LOG.warning("Network not available, retrying in %.1f seconds...", retry_delay)
+            await asyncio.sleep(retry_delay)
     
     _LOG.error("Network connection not available after %d attempts", max_retries)
     return False
@@ -567,9 +1135,10 @@ async def on_r2_connect_cmd() -> None:
     """Handle connect event from Remote Two."""
     _LOG.info("Connect command received from Remote Two")
     
-    # Check current entities first
-    entities = api.available_entities.get_all()
-    _LOG.info("Found %d available entities at connect", len(entities))
+    # get_all() serializes every entity, so only walk them when debugging
+    if _LOG.isEnabledFor(logging.DEBUG):
+        entities = api.available_entities.get_all()
+        _LOG.debug("Found %d available entities at connect", len(entities))
     
     # Set device state to CONNECTED first so Remote can see the entities
     _LOG.info("Setting device state to CONNECTED")
@@ -578,53 +1147,79 @@ async def on_r2_connect_cmd() -> None:
     
     # Check if we have configuration but need to update entity values
     if _fyta_config and _fyta_config.email:
-        _LOG.info("Configuration exists - checking connectivity to update entities")
-        
-        if await is_network_connected():
-            try:
-                # Try to re-authenticate with FYTA API
-                auth_response = await authenticate_fyta(_fyta_config.email, _fyta_config.password)
-                if auth_response and "access_token" in auth_response:
-                    _LOG.info("Successfully re-authenticated with FYTA API during connect")
-                    # Update tokens in config
-                    _fyta_config.access_token = auth_response.get("access_token")
-                    _fyta_config.refresh_token = auth_response.get("refresh_token")
-                    _fyta_config.expires_in = auth_response.get("expires_in")
-                    save_config(_fyta_config)
-                    
-                    # Update entity data using the new function
-                    success = await update_plant_data()
-                    if success:
-                        _LOG.info("Successfully updated entities on connect")
-                    else:
-                        _LOG.warning("No entities were updated on connect")
-                else:
-                    _LOG.error("Failed to re-authenticate with FYTA API during connect")
-            except Exception as e:
-                _LOG.error("Error during connect re-authentication: %s", e)
-        else:
-            _LOG.warning("Network not available during connect - using stored entities only")
-            # Will continue using the stored entities loaded during startup
+        # Refresh in the background so the connect event is handled right away
+        start_background_refresh(refresh_entities_on_connect)
     else:
         _LOG.warning("No configuration available during connect")
 
 
+def start_background_refresh(refresh) -> None:
+    """
+    Run an entity refresh in the background unless one is already running.
+
+    Startup and repeated connect events share a single refresh, so they
+    don't authenticate and fetch all plants concurrently.
+
+    :param refresh: Coroutine function performing the refresh
+    """
+    global _refresh_task
+    if _refresh_task is not None and not _refresh_task.done():
+        _LOG.info("Entity refresh already running - not starting another one")
+        return
+    _refresh_task = asyncio.create_task(refresh())
+
+
+async def refresh_entities_on_connect() -> None:
+    """
+    Re-authenticate if needed and update entity values after a connect event.
+    
+    There is no separate connectivity probe, if the network is down the API
+    requests fail and the stored entities loaded during startup stay in use.
+    """
+    _LOG.info("Configuration exists - updating entities")
+    
+    if not await refresh_all_plants("connect"):
+        _LOG.warning("Entities not refreshed during connect - using stored entities")
+
+
+async def refresh_all_plants(context: str) -> bool:
+    """
+    Make sure a valid access token is available and update all plant entities.
+    
+    The stored token is reused while it is valid, so a refresh only costs the
+    plant requests. Otherwise the saved credentials are used to log in again.
+    
+    :param context: What triggered the refresh, used in log messages
+    :return: True if entities were updated
+    """
+    try:
+        if token_valid(_fyta_config):
+            _LOG.info("Reusing valid FYTA access token during %s", context)
+        elif not await reauthenticate(f"no valid access token during {context}"):
+            _LOG.error("Failed to re-authenticate with FYTA API during %s", context)
+            return False
+        
+        success = await update_plant_data()
+        if success:
+            _LOG.info("Successfully updated entities during %s", context)
+        else:
+            _LOG.warning("No entities were updated during %s", context)
+        return success
+    except Exception as e:
+        _LOG.error("Error refreshing entities during %s: %s", context, e)
+        return False
+
+
 def get_measurement_status_text(status_code) -> str:
-    """Convert measurement status code to text."""
-    if status_code == 0:
-        return "No Data"
-    elif status_code == 1:
-        return "Too Low"
-    elif status_code == 2:
-        return "Low"
-    elif status_code == 3:
-        return "Perfect"
-    elif status_code == 4:
-        return "High"
-    elif status_code == 5:
-        return "Too High"
-    else:
-        return "Unknown"
+    """
+    Convert measurement status code to text.
+
+    This is a single tuple lookup, so it is not wrapped in lru_cache: a cache
+    would be no faster and would fail on unhashable values from the API.
+    """
+    if isinstance(status_code, int) and 0 <= status_code < len(_STATUS_TEXT):
+        return _STATUS_TEXT[status_code]
+    return STATUS_UNKNOWN
 
 
 @api.listens_to(ucapi.Events.DISCONNECT)
@@ -658,42 +1253,20 @@ async def on_subscribe_entities(entity_ids: list[str]) -> None:
                 _LOG.error("Entity %s not found in available entities", entity_id)
                 continue
         
-        # Check if entity is a temperature sensor
-        if entity and isinstance(entity, PlantTemperatureSensor):
-            # Set initial state to ON
-            _LOG.info("Setting initial state of temperature sensor %s", entity_id)
-            
-            # Get current value from the entity (might be from storage or fresh data)
-            current_value = entity.attributes.get(Attributes.VALUE, "0")
-            
-            # Update the attributes using the configured_entities method
-            api.configured_entities.update_attributes(
-                entity_id, 
-                {
-                    Attributes.STATE: States.ON,
-                    Attributes.VALUE: current_value,
-                    Attributes.UNIT: "°C"
-                }
-            )
-            _LOG.info("Updated temperature entity %s with value %s", entity_id, current_value)
+        kind = _sensor_kind.get(entity_id)
+        spec = _SUB_DEFAULTS.get(kind)
+        if spec is None:
+            continue
+        default_value, base_attributes = spec
         
-        # Check if entity is a moisture sensor
-        elif entity and isinstance(entity, PlantMoistureSensor):
-            # Set initial state to ON
-            _LOG.info("Setting initial state of moisture sensor %s", entity_id)
-            
-            # Get current value from the entity (might be from storage or fresh data)
-            current_value = entity.attributes.get(Attributes.VALUE, "Unknown")
-            
-            # Update the attributes using the configured_entities method
-            api.configured_entities.update_attributes(
-                entity_id, 
-                {
-                    Attributes.STATE: States.ON,
-                    Attributes.VALUE: current_value
-                }
-            )
-            _LOG.info("Updated moisture entity %s with value %s", entity_id, current_value)
+        # Get current value from the entity (might be from storage or fresh data)
+        current_value = entity.attributes.get(_ATTR_VALUE, default_value)
+        
+        # Set the state to ON using the configured_entities method
+        api.configured_entities.update_attributes(
+            entity_id, {**base_attributes, _ATTR_VALUE: current_value}
+        )
+        _LOG.info("Updated %s entity %s with value %s", kind, entity_id, current_value)
 
 
 async def update_entities_from_api():
@@ -702,31 +1275,82 @@ async def update_entities_from_api():
     
     # Wait for network connectivity before authenticating
     if await wait_for_network_connection():
-        # Try to re-authenticate with saved credentials
-        try:
-            auth_response = await authenticate_fyta(_fyta_config.email, _fyta_config.password)
-            if auth_response and "access_token" in auth_response:
-                _LOG.info("Successfully re-authenticated with FYTA API")
-                # Update tokens in config
-                _fyta_config.access_token = auth_response.get("access_token")
-                _fyta_config.refresh_token = auth_response.get("refresh_token")
-                _fyta_config.expires_in = auth_response.get("expires_in")
-                save_config(_fyta_config)
-                
-                # Update plant sensors using the new function
-                success = await update_plant_data()
-                if success:
-                    _LOG.info("Successfully updated entities from API during startup")
-                else:
-                    _LOG.warning("No entities were updated during startup update")
-            else:
-                _LOG.error("Failed to re-authenticate with FYTA API")
-        except Exception as e:
-            _LOG.error("Error during startup authentication: %s", e)
+        await refresh_all_plants("startup")
     else:
         _LOG.warning("Network not available during startup - will try to reconnect later")
 
 
+def apply_plant_update(plant: dict, plant_id: str, plant_details: Optional[dict],
+                       new_sensors: List[PlantSensor], pending_updates: Dict[str, dict],
+                       is_configured: Callable[[str], bool]) -> bool:
+    """
+    Update or create the sensors of one plant from its measurements.
+    
+    :param plant: Plant from the user plant list
+    :param plant_id: FYTA plant ID as a string
+    :param plant_details: Plant details with the measurements, may be empty
+    :param new_sensors: Created sensors are appended here for registration
+    :param pending_updates: Attributes to push for configured entities, by entity ID
+    :param is_configured: Bound configured_entities.contains, looked up once per update
+    :return: True if a sensor was updated or created
+    """
+    nickname = plant.get("nickname", f"Plant {plant_id}")
+    measurements = plant_details.get("measurements") if plant_details else None
+    if measurements is None:
+        _LOG.warning("No measurement data for plant %s, skipping", nickname)
+        return False
+    
+    debug_enabled = _LOG.isEnabledFor(logging.DEBUG)
+    updated = False
+    
+    # Check for battery low condition
+    battery_low = False
+    sensor_info = plant_details.get("sensor")
+    if sensor_info and sensor_info.get("is_battery_low", False):
+        battery_low = True
+        _LOG.warning("Plant %s has low battery", nickname)
+    
+    # Both sensors of a plant are found with a single lookup, then each one
+    # with data is updated, or created if the plant didn't have it yet
+    sensors = list(_plant_sensors.get(plant_id, (None, None)))
+    for index, sensor_class in enumerate(_PAIR_CLASSES):
+        data = measurements.get(sensor_class.MEASUREMENT)
+        if not data:
+            continue
+        
+        sensor = sensors[index]
+        if sensor is None:
+            sensor = sensor_class(
+                plant_id=plant_id,
+                nickname=nickname,
+                scientific_name=plant.get("scientific_name", "Unknown")
+            )
+            sensor.apply_measurement(data, battery_low)
+            
+            # Store the sensor, it is registered after all plants are processed
+            sensors[index] = sensor
+            _plant_sensors[plant_id] = tuple(sensors)
+            _sensor_kind[sensor.id] = sensor.SENSOR_TYPE
+            _dirty_sensors[sensor.id] = sensor
+            new_sensors.append(sensor)
+            action = "Created new"
+        else:
+            if sensor.apply_measurement(data, battery_low):
+                _dirty_sensors[sensor.id] = sensor
+            
+            # Update configured entity if it exists
+            if is_configured(sensor.id):
+                pending_updates[sensor.id] = {**sensor.ON_ATTRIBUTES, _ATTR_VALUE: sensor.attributes[_ATTR_VALUE]}
+            action = "Updated"
+        
+        if debug_enabled:
+            _LOG.debug("%s %s entity %s with value %s",
+                       action, sensor.SENSOR_TYPE, sensor.id, sensor.attributes[_ATTR_VALUE])
+        updated = True
+    
+    return updated
+
+
 async def update_plant_data() -> bool:
     """
     Update all plant data from the FYTA API and store the results.
@@ -749,200 +1373,79 @@ async def update_plant_data() -> bool:
         
         _LOG.info("Retrieved %d plants from FYTA API for update", len(plants))
         updates_made = False
+        new_sensors = []  # Sensors created in this update, registered in one pass after the loop
+        pending_updates = {}  # Entity ID -> attributes for configured entities, sent in one pass after the loop
         
-        # Process each plant
-        for plant in plants:
+        # Only plants with a sensor have measurements to fetch
+        debug_enabled = _LOG.isEnabledFor(logging.DEBUG)
+        sensor_plants = [plant for plant in plants if (plant.get("sensor") or {}).get("has_sensor")]
+        if debug_enabled and len(sensor_plants) < len(plants):
+            _LOG.debug("Skipping %d plants without a sensor", len(plants) - len(sensor_plants))
+        
+        # Plants whose "updated_at" didn't change since they were last applied
+        # are left as they are, but only for PLANT_DETAILS_CACHE_SECONDS as the
+        # list entry doesn't have to change when new measurements arrive
+        now = time.monotonic()
+        plant_ids = []
+        changed_plants = []
+        for plant in sensor_plants:
             plant_id = str(plant.get("id"))
-            nickname = plant.get("nickname", f"Plant {plant_id}")
-            
-            # Check if this plant has a sensor
-            has_sensor = False
-            sensor = plant.get("sensor")
-            if sensor is not None:
-                has_sensor = sensor.get("has_sensor", False)
-            
-            if not has_sensor:
-                _LOG.debug("Plant %s has no sensor, skipping", nickname)
-                continue
-            
-            # Define entity IDs
-            temp_entity_id = f"fyta-plant-{plant_id}"
-            moisture_entity_id = f"fyta-moisture-{plant_id}"
-            
+            updated_at = plant.get("updated_at")
+            version = _plant_version.get(plant_id)
+            if updated_at is None or version is None or version[0] != updated_at or now >= version[1]:
+                changed_plants.append(plant)
+                plant_ids.append(plant_id)
+        unchanged_count = len(sensor_plants) - len(changed_plants)
+        if unchanged_count and not changed_plants:
+            # All sensors are up to date, which counts as a successful update
+            updates_made = True
+        sensor_plants = changed_plants
+        
+        # Fetch the details of all plants concurrently instead of one after another
+        details_list = await asyncio.gather(
+            *(get_plant_measurements(plant, plant_id) for plant, plant_id in zip(sensor_plants, plant_ids)),
+            return_exceptions=True
+        )
+        
+        # Bind the O(1) membership check once, get_all() would build the attributes of every entity
+        is_configured = api.configured_entities.contains
+        
+        # Process each plant, a failure only skips that plant
+        for plant, plant_id, plant_details in zip(sensor_plants, plant_ids, details_list):
             try:
-                # Get detailed plant information
-                plant_details = await get_plant_details(plant_id)
-                if not plant_details or "measurements" not in plant_details:
-                    _LOG.warning("No measurement data for plant %s, skipping", nickname)
-                    continue
-                
-                # Check for battery low condition
-                battery_low = False
-                if "sensor" in plant_details and plant_details["sensor"].get("is_battery_low", False):
-                    battery_low = True
-                    _LOG.warning("Plant %s has low battery", nickname)
-                
-                measurements = plant_details.get("measurements", {})
-                scientific_name = plant.get("scientific_name", "Unknown")
-                
-                # Process temperature data
-                if "temperature" in measurements and isinstance(measurements["temperature"], dict):
-                    temp_data = measurements["temperature"]
-                    temp_values = temp_data.get("values", {})
-                    temp_status = temp_data.get("status")
-                    
-                    # Check if temperature entity exists
-                    if api.available_entities.contains(temp_entity_id):
-                        # Update existing entity
-                        temp_sensor = _plant_sensors.get(temp_entity_id)
-                        if temp_sensor:
-                            # Update temperature value
-                            if temp_status == 0:
-                                temp_sensor.attributes[Attributes.VALUE] = "0"
-                            elif temp_values and "current" in temp_values:
-                                temp_value = temp_values["current"]
-                                if not isinstance(temp_value, str):
-                                    temp_value = str(temp_value)
-                                temp_sensor.attributes[Attributes.VALUE] = temp_value
-                            
-                            # Update status text
-                            temp_sensor.attributes["status"] = get_measurement_status_text(temp_status)
-                            
-                            # Update configured entity if it exists
-                            if api.configured_entities.contains(temp_entity_id):
-                                api.configured_entities.update_attributes(
-                                    temp_entity_id,
-                                    {
-                                        Attributes.STATE: States.ON,
-                                        Attributes.VALUE: temp_sensor.attributes[Attributes.VALUE],
-                                        Attributes.UNIT: "°C"
-                                    }
-                                )
-                            
-                            _LOG.info("Updated temperature entity %s with value %s", 
-                                    temp_entity_id, temp_sensor.attributes[Attributes.VALUE])
-                            updates_made = True
-                    else:
-                        # Create new temperature entity
-                        temp_sensor = PlantTemperatureSensor(
-                            plant_id=plant_id,
-                            nickname=nickname,
-                            scientific_name=scientific_name
-                        )
-                        
-                        # Set initial values
-                        if temp_status == 0:
-                            temp_sensor.attributes[Attributes.VALUE] = "0"
-                        elif temp_values and "current" in temp_values:
-                            temp_value = temp_values["current"]
-                            if not isinstance(temp_value, str):
-                                temp_value = str(temp_value)
-                            temp_sensor.attributes[Attributes.VALUE] = temp_value
-                        
-                        # Set status text
-                        temp_sensor.attributes["status"] = get_measurement_status_text(temp_status)
-                        
-                        # Store and register the sensor
-                        _plant_sensors[temp_sensor.id] = temp_sensor
-                        api.available_entities.add(temp_sensor)
-                        
-                        _LOG.info("Created new temperature entity %s with value %s", 
-                                temp_sensor.id, temp_sensor.attributes[Attributes.VALUE])
-                        updates_made = True
-                
-                # Process moisture data
-                if "moisture" in measurements and isinstance(measurements["moisture"], dict):
-                    moisture_data = measurements["moisture"]
-                    moisture_status_code = moisture_data.get("status")
-                    moisture_values = moisture_data.get("values", {})
-                    
-                    # Check if moisture entity exists
-                    if api.available_entities.contains(moisture_entity_id):
-                        # Update existing entity
-                        moisture_sensor = _plant_sensors.get(moisture_entity_id)
-                        if moisture_sensor:
-                            # Update moisture status
-                            if moisture_status_code == 0:
-                                moisture_sensor.attributes[Attributes.VALUE] = "No Data"
-                            elif moisture_status_code == 1 and moisture_values.get("current") == "0":
-                                moisture_sensor.attributes[Attributes.VALUE] = "Too Low"
-                            else:
-                                moisture_sensor.attributes[Attributes.VALUE] = get_measurement_status_text(moisture_status_code)
-                            
-                            # Add battery warning if applicable
-                            if battery_low:
-                                current_value = moisture_sensor.attributes[Attributes.VALUE]
-                                moisture_sensor.attributes[Attributes.VALUE] = f"{current_value} (Battery Low)"
-                            
-                            # Update configured entity if it exists
-                            if api.configured_entities.contains(moisture_entity_id):
-                                api.configured_entities.update_attributes(
-                                    moisture_entity_id,
-                                    {
-                                        Attributes.STATE: States.ON,
-                                        Attributes.VALUE: moisture_sensor.attributes[Attributes.VALUE]
-                                    }
-                                )
-                            
-                            _LOG.info("Updated moisture entity %s with value %s", 
-                                    moisture_entity_id, moisture_sensor.attributes[Attributes.VALUE])
-                            updates_made = True
-                    else:
-                        # Create new moisture entity
-                        moisture_sensor = PlantMoistureSensor(
-                            plant_id=plant_id,
-                            nickname=nickname,
-                            scientific_name=scientific_name
-                        )
-                        
-                        # Set initial values
-                        if moisture_status_code == 0:
-                            moisture_sensor.attributes[Attributes.VALUE] = "No Data"
-                        elif moisture_status_code == 1 and moisture_values.get("current") == "0":
-                            moisture_sensor.attributes[Attributes.VALUE] = "Too Low"
-                        else:
-                            moisture_sensor.attributes[Attributes.VALUE] = get_measurement_status_text(moisture_status_code)
-                        
-                        # Add battery warning if applicable
-                        if battery_low:
-                            current_value = moisture_sensor.attributes[Attributes.VALUE]
-                            moisture_sensor.attributes[Attributes.VALUE] = f"{current_value} (Battery Low)"
-                        
-                        # Store and register the sensor
-                        _plant_sensors[moisture_sensor.id] = moisture_sensor
-                        api.available_entities.add(moisture_sensor)
-                        
-                        _LOG.info("Created new moisture entity %s with value %s", 
-                                moisture_sensor.id, moisture_sensor.attributes[Attributes.VALUE])
-                        updates_made = True
-                
+                if isinstance(plant_details, Exception):
+                    raise plant_details
+                if apply_plant_update(plant, plant_id, plant_details, new_sensors, pending_updates, is_configured):
+                    updates_made = True
+                    updated_at = plant.get("updated_at")
+                    if updated_at is not None:
+                        _plant_version[plant_id] = (updated_at, time.monotonic() + PLANT_DETAILS_CACHE_SECONDS)
             except Exception as e:
-                _LOG.error("Error updating plant %s: %s", nickname, e)
-                continue
+                # Only format the traceback when debugging
+                nickname = plant.get("nickname", f"Plant {plant_id}")
+                _LOG.error("Error updating plant %s: %s", nickname, e, exc_info=debug_enabled)
         
-        # Store entities if updates were made
-        if updates_made:
-            _LOG.info("Storing updated entities to file")
-            entities_data = {}
-            for entity_id, entity in _plant_sensors.items():
-                if isinstance(entity, PlantTemperatureSensor):
-                    entities_data[entity_id] = {
-                        "type": "temperature",
-                        "plant_id": entity.plant_id,
-                        "nickname": entity.name,
-                        "scientific_name": entity.scientific_name,
-                        "attributes": entity.attributes
-                    }
-                elif isinstance(entity, PlantMoistureSensor):
-                    entities_data[entity_id] = {
-                        "type": "moisture",
-                        "plant_id": entity.plant_id,
-                        "nickname": entity.name,
-                        "scientific_name": entity.scientific_name,
-                        "attributes": entity.attributes
-                    }
-            
-            store_entities(entities_data)
+        # Register all newly created sensors with the Remote, add() reports
+        # whether the entity was new so no separate contains() probe is needed
+        for new_sensor in new_sensors:
+            if not api.available_entities.add(new_sensor):
+                _LOG.warning("Entity %s was already registered", new_sensor.id)
+        
+        # Push the new values of configured entities to the Remote once all plants are processed
+        update_attributes = api.configured_entities.update_attributes
+        for entity_id, attributes in pending_updates.items():
+            update_attributes(entity_id, attributes)
+        
+        _LOG.info("Refreshed %d changed plants, %d unchanged: %d new sensors, %d configured entities updated",
+                  len(sensor_plants), unchanged_count, len(new_sensors), len(pending_updates))
+        
+        # Store only the records of sensors that changed since the last store,
+        # together with records left over from a failed write
+        if _dirty_sensors or _pending_entities is not None:
+            _LOG.info("Storing %d changed entities to file", len(_dirty_sensors))
+            changed_entities = {entity_id: sensor.to_dict() for entity_id, sensor in _dirty_sensors.items()}
+            _dirty_sensors.clear()
+            schedule_store_entities(changed_entities)
         
         return updates_made
         
@@ -951,43 +1454,87 @@ async def update_plant_data() -> bool:
         return False
 
 
+def sensor_values() -> tuple:
+    """Get the current value of every plant sensor, to tell whether an update changed anything."""
+    return tuple(
+        sensor.attributes.get(_ATTR_VALUE)
+        for pair in _plant_sensors.values()
+        for sensor in pair
+        if sensor is not None
+    )
+
+
 async def start_periodic_updates(interval_minutes=15):
     """
     Start periodic updates of plant data from FYTA API.
     
+    Runs are scheduled against deadlines on the loop clock, so the time an
+    update takes doesn't push the following ones back. While updates keep
+    returning the same sensor values the interval is doubled, up to
+    PERIODIC_MAX_INTERVAL_MINUTES. Any change goes back to the base interval.
+    A failed update is retried after PERIODIC_RETRY_SECONDS, doubling on
+    each further failure up to the current interval.
+    
     :param interval_minutes: How often to update data, in minutes
     """
     _LOG.info("Starting periodic updates every %d minutes", interval_minutes)
+    loop = asyncio.get_running_loop()
+    current_interval = interval_minutes
+    unchanged_streak = 0
+    failures = 0
+    next_run = loop.time() + current_interval * 60
     
     while True:
         try:
-            # Wait for the specified interval
-            await asyncio.sleep(interval_minutes * 60)
+            # Wait until the next deadline
+            await asyncio.sleep(max(0.0, next_run - loop.time()))
             
-            # Only update if network is connected
-            if await is_network_connected():
-                _LOG.info("Running scheduled update (every %d minutes)", interval_minutes)
-                success = await update_plant_data()
-                if success:
-                    _LOG.info("Scheduled update completed successfully")
-                else:
-                    _LOG.warning("Scheduled update completed with no changes")
+            # A failed request (e.g. no network) is the connectivity check, no separate probe
+            _LOG.info("Running scheduled update (every %d minutes)", current_interval)
+            values_before = sensor_values()
+            success = await update_plant_data()
+            if not success:
+                failures += 1
+                retry_seconds = min(PERIODIC_RETRY_SECONDS * 2 ** (failures - 1), current_interval * 60)
+                _LOG.warning("Scheduled update failed or found no plants - retrying in %d seconds", retry_seconds)
+                next_run = loop.time() + retry_seconds
+                continue
+            _LOG.info("Scheduled update completed successfully")
+            failures = 0
+            
+            if sensor_values() != values_before:
+                unchanged_streak = 0
+                current_interval = interval_minutes
             else:
-                _LOG.warning("Network not available for scheduled update - will try again later")
+                unchanged_streak += 1
+                if unchanged_streak >= PERIODIC_BACKOFF_AFTER_UNCHANGED:
+                    current_interval = min(current_interval * 2, PERIODIC_MAX_INTERVAL_MINUTES)
+            
+            # Count from this run's deadline, an update that overran its slot runs once right away
+            next_run = max(next_run + current_interval * 60, loop.time())
         except Exception as e:
             _LOG.error("Error during scheduled update: %s", e)
             # Continue the loop even if there was an error
+            next_run = loop.time() + current_interval * 60
 
 
 async def main():
     """Main entry point for the integration."""
     global _fyta_config, _plant_sensors
     
-    # Configure logging
+    # Configure logging, FYTA_LOG selects the level (e.g. DEBUG) without code changes
+    # Thread and process details are not part of the format, so don't collect them
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    log_level = os.getenv("FYTA_LOG", "INFO").upper()
+    known_level = log_level in logging.getLevelNamesMapping()
     logging.basicConfig(
-        level=logging.INFO,
+        level=log_level if known_level else logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
+    if not known_level:
+        _LOG.warning("Unknown log level %r in FYTA_LOG, using INFO", log_level)
 
     # Set higher log level for websockets to prevent ping/pong spam
     logging.getLogger('websockets.server').setLevel(logging.WARNING)
@@ -997,6 +1544,8 @@ async def main():
     
     # Load existing configuration
     _fyta_config = load_config()
+    if _fyta_config:
+        set_auth_token(_fyta_config.access_token)
 
     # Initialize the integration with driver.json and setup handler
     _LOG.info("Initializing UC Remote integration API")
@@ -1009,59 +1558,38 @@ async def main():
     
     if stored_entities:
         _plant_sensors = {}
+        _sensor_kind.clear()
         for entity_id, entity_data in stored_entities.items():
             try:
-                if entity_data["type"] == "temperature":
-                    # Get nickname - handle both string and dict formats
-                    nickname = entity_data.get("nickname", "Unknown Plant")
-                    if isinstance(nickname, dict):
-                        # If nickname is a dictionary, convert to string
-                        nickname = str(nickname)
-                    elif isinstance(nickname, str) and " Temperature" in nickname:
-                        # If it's a string with suffix, remove the suffix
-                        nickname = nickname.replace(" Temperature", "")
-                    
-                    # Create temperature sensor
-                    sensor = PlantTemperatureSensor(
-                        plant_id=entity_data["plant_id"],
-                        nickname=nickname,
-                        scientific_name=entity_data.get("scientific_name", "Unknown")
-                    )
-                    
-                    # Set stored attributes if available
-                    if "attributes" in entity_data:
-                        # Set only the most essential attributes for initial display
-                        sensor.attributes[Attributes.VALUE] = entity_data["attributes"].get(Attributes.VALUE, "0")
-                        
-                    _plant_sensors[entity_id] = sensor
-                    api.available_entities.add(sensor)
-                    _LOG.info("Loaded temperature entity %s from storage", entity_id)
+                sensor_class = _SENSOR_CLASSES.get(entity_data["type"])
+                if sensor_class is None:
+                    _LOG.warning("Unknown type of stored entity %s, skipping", entity_id)
+                    continue
+                
+                # Records written before schema version 1 stored the entity name
+                nickname = entity_data.get("nickname", "Unknown Plant")
+                if entity_data.get("schema_version", 0) < ENTITIES_SCHEMA_VERSION:
+                    nickname = legacy_nickname(nickname, sensor_class.NAME_SUFFIX)
+                
+                sensor = sensor_class(
+                    plant_id=entity_data["plant_id"],
+                    nickname=nickname,
+                    scientific_name=entity_data.get("scientific_name", "Unknown")
+                )
+                
+                # Set stored attributes if available
+                if "attributes" in entity_data:
+                    # Set only the most essential attributes for initial display
+                    sensor.restore_attributes(entity_data["attributes"])
                 
-                elif entity_data["type"] == "moisture":
-                    # Get nickname - handle both string and dict formats
-                    nickname = entity_data.get("nickname", "Unknown Plant")
-                    if isinstance(nickname, dict):
-                        # If nickname is a dictionary, convert to string
-                        nickname = str(nickname)
-                    elif isinstance(nickname, str) and " Moisture" in nickname:
-                        # If it's a string with suffix, remove the suffix
-                        nickname = nickname.replace(" Moisture", "")
-                    
-                    # Create moisture sensor
-                    sensor = PlantMoistureSensor(
-                        plant_id=entity_data["plant_id"],
-                        nickname=nickname,
-                        scientific_name=entity_data.get("scientific_name", "Unknown")
-                    )
-                    
-                    # Set stored attributes if available
-                    if "attributes" in entity_data:
-                        # Set only the most essential attributes for initial display
-                        sensor.attributes[Attributes.VALUE] = entity_data["attributes"].get(Attributes.VALUE, "Unknown")
-                        
-                    _plant_sensors[entity_id] = sensor
-                    api.available_entities.add(sensor)
-                    _LOG.info("Loaded moisture entity %s from storage", entity_id)
+                # Both sensors of a plant are kept as one pair
+                plant_key = str(entity_data["plant_id"])
+                sensors = list(_plant_sensors.get(plant_key, (None, None)))
+                sensors[_PAIR_CLASSES.index(sensor_class)] = sensor
+                _plant_sensors[plant_key] = tuple(sensors)
+                _sensor_kind[entity_id] = sensor.SENSOR_TYPE
+                api.available_entities.add(sensor)
+                _LOG.info("Loaded %s entity %s from storage", sensor.SENSOR_TYPE, entity_id)
             except Exception as e:
                 _LOG.error("Error loading entity %s: %s", entity_id, e)
     
@@ -1076,7 +1604,7 @@ async def main():
         
         # Start a background task to update entities from API
         # This way the integration can respond to Remote Two immediately
-        asyncio.create_task(update_entities_from_api())
+        start_background_refresh(update_entities_from_api)
         
         # Start periodic updates - run every 15 minutes for testing
         _LOG.info("Starting periodic updates")
@@ -1093,4 +1621,9 @@ if __name__ == "__main__":
         # Keep the server running
         _LOOP.run_forever()
     except KeyboardInterrupt:
-        pass 
\ No newline at end of file
+        pass
+    finally:
+        # Finish an entities file write that is still in progress
+        if _store_task is not None and not _store_task.done():
+            _LOOP.run_until_complete(_store_task)
+        _LOOP.run_until_complete(close_http_client())